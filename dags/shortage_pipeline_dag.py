@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict
 
-import pandas as pd
 from airflow.decorators import dag, task
 
 from src import analytics, ingest, report, shortage_logic, transform
-from src.io import write_parquet
+from src.io import read_parquet, write_parquet
 from src.quality import run_quality_checks
 from src.utils import (
     RulesConfig,
@@ -65,7 +65,7 @@ def shortage_pipeline():
     def transform_data(ingested_path: str) -> str:
         configs = _load_configs()
         settings = configs["settings"]
-        df = pd.read_parquet(ingested_path)
+        df = read_parquet(Path(ingested_path))
         transformed = transform.transform_invoices(df, settings)
         report.export_clean_dataset(transformed, settings)
         staging_path = settings.output_processed_dir / "_staging_transformed.parquet"
@@ -73,39 +73,21 @@ def shortage_pipeline():
         return str(staging_path)
 
     @task()
-    def apply_shortage_logic(transformed_path: str) -> str:
+    def detect_shortages(transformed_path: str) -> Dict[str, str]:
         configs = _load_configs()
         settings = configs["settings"]
         rules = configs["rules"]
-        df = pd.read_parquet(transformed_path)
+        df = read_parquet(Path(transformed_path))
         flagged = shortage_logic.apply_shortage_logic(df, settings, rules)
+        run_quality_checks(flagged, settings, rules)
         report.export_shortage_outputs(flagged, settings)
-        flagged_path = settings.output_processed_dir / "_staging_flagged.parquet"
-        write_parquet(flagged, flagged_path)
-        return str(flagged_path)
-
-    @task()
-    def compute_analytics(flagged_path: str) -> Dict[str, str]:
-        configs = _load_configs()
-        settings = configs["settings"]
-        df = pd.read_parquet(flagged_path)
-        tables = analytics.compute_kpis(df, settings)
+        tables = analytics.compute_kpis(flagged, settings)
         exported = report.export_analytics_tables(tables, settings)
         return {key: str(path) for key, path in exported.items()}
 
-    @task()
-    def validate_data(flagged_path: str) -> None:
-        configs = _load_configs()
-        settings = configs["settings"]
-        rules = configs["rules"]
-        df = pd.read_parquet(flagged_path)
-        run_quality_checks(df, settings, rules)
-
     ingested = ingest_data()
     transformed = transform_data(ingested)
-    flagged = apply_shortage_logic(transformed)
-    compute_analytics(flagged)
-    validate_data(flagged)
+    detect_shortages(transformed)
 
 
 dag_instance = shortage_pipeline()
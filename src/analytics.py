@@ -17,64 +17,75 @@ def compute_kpis(df: pd.DataFrame, settings: SettingsConfig) -> Dict[str, pd.Dat
     """Compute KPI tables from the shortage-evaluated DataFrame."""
 
     LOGGER.info("Computing analytics tables")
-    shortage_df = df[df["Shortage_Flag"]].copy()
+    is_shortage = df["Shortage_Flag"].to_numpy(dtype=bool)
+    is_aged = (df["Age_Bucket"] == "Aged").to_numpy(dtype=bool)
+    is_aged_shortage = is_aged & is_shortage
+    shortage_amount = df["Shortage_Amount_USD"]
 
     total_shortage_amount = round(
-        float(shortage_df["Shortage_Amount_USD"].sum()), settings.round_decimals
+        float(shortage_amount[is_shortage].sum()), settings.round_decimals
     )
     total_shortage = pd.DataFrame(
         {
-            "Shortage_Count": [int(shortage_df.shape[0])],
+            "Shortage_Count": [int(is_shortage.sum())],
             "Total_Shortage_USD": [total_shortage_amount],
         }
     )
 
-    annual_shortages = (
-        shortage_df.groupby("Payment_Year", dropna=True)
-        .agg(
-            Shortage_Count=("Shortage_Flag", "sum"),
-            Total_Shortage_USD=("Shortage_Amount_USD", "sum"),
-            Mean_Shortage_USD=("Shortage_Amount_USD", "mean"),
+    # One grouping pass; each KPI table is a projection of these per-year sums.
+    by_year = (
+        pd.DataFrame(
+            {
+                "Payment_Year": df["Payment_Year"],
+                "Shortage_Count": is_shortage,
+                "Shortage_USD": shortage_amount.where(is_shortage, 0.0),
+                "Aged_Count": is_aged,
+                "Aged_Invoice_Count": is_aged & df["Randomized Invoice"].notna().to_numpy(),
+                "Aged_Invoice_USD": df["Invoice Amount"].where(is_aged, 0.0),
+                "Aged_Amount_USD": shortage_amount.where(is_aged, 0.0),
+                "Aged_Shortage_Count": is_aged_shortage,
+                "Aged_Shortage_USD": shortage_amount.where(is_aged_shortage, 0.0),
+            },
+            index=df.index,
         )
+        .groupby("Payment_Year", dropna=True)
+        .sum()
         .reset_index()
     )
-    if not annual_shortages.empty:
-        annual_shortages["Shortage_Count"] = annual_shortages["Shortage_Count"].astype(int)
+
+    shortage_years = by_year[by_year["Shortage_Count"] > 0]
+    annual_shortages = pd.DataFrame(
+        {
+            "Payment_Year": shortage_years["Payment_Year"],
+            "Shortage_Count": shortage_years["Shortage_Count"].astype(int),
+            "Total_Shortage_USD": shortage_years["Shortage_USD"],
+            "Mean_Shortage_USD": shortage_years["Shortage_USD"] / shortage_years["Shortage_Count"],
+        }
+    ).reset_index(drop=True)
     for column in ("Total_Shortage_USD", "Mean_Shortage_USD"):
         annual_shortages[column] = annual_shortages[column].round(settings.round_decimals)
 
-    aged_shortages = shortage_df[shortage_df["Age_Bucket"] == "Aged"].copy()
-    aged_shortages_by_year = (
-        aged_shortages.groupby("Payment_Year", dropna=True)
-        .agg(
-            Shortage_Count=("Shortage_Flag", "sum"),
-            Total_Shortage_USD=("Shortage_Amount_USD", "sum"),
-        )
-        .reset_index()
-    )
-    if not aged_shortages_by_year.empty:
-        aged_shortages_by_year["Shortage_Count"] = aged_shortages_by_year["Shortage_Count"].astype(int)
-    aged_shortages_by_year["Total_Shortage_USD"] = aged_shortages_by_year[
-        "Total_Shortage_USD"
-    ].round(settings.round_decimals)
-
-    aged_invoices = df[df["Age_Bucket"] == "Aged"].copy()
-    aged_invoices_by_year = (
-        aged_invoices.groupby("Payment_Year", dropna=True)
-        .agg(
-            Invoice_Count=("Randomized Invoice", "count"),
-            Shortage_Count=("Shortage_Flag", "sum"),
-            Total_Invoice_USD=("Invoice Amount", "sum"),
-            Total_Shortage_USD=("Shortage_Amount_USD", "sum"),
-        )
-        .reset_index()
-    )
-    if not aged_invoices_by_year.empty:
-        aged_invoices_by_year["Shortage_Count"] = aged_invoices_by_year["Shortage_Count"].astype(int)
-        for column in ("Total_Invoice_USD", "Total_Shortage_USD"):
-            aged_invoices_by_year[column] = aged_invoices_by_year[column].round(
+    aged_shortage_years = by_year[by_year["Aged_Shortage_Count"] > 0]
+    aged_shortages_by_year = pd.DataFrame(
+        {
+            "Payment_Year": aged_shortage_years["Payment_Year"],
+            "Shortage_Count": aged_shortage_years["Aged_Shortage_Count"].astype(int),
+            "Total_Shortage_USD": aged_shortage_years["Aged_Shortage_USD"].round(
                 settings.round_decimals
-            )
+            ),
+        }
+    ).reset_index(drop=True)
+
+    aged_years = by_year[by_year["Aged_Count"] > 0]
+    aged_invoices_by_year = pd.DataFrame(
+        {
+            "Payment_Year": aged_years["Payment_Year"],
+            "Invoice_Count": aged_years["Aged_Invoice_Count"].astype(int),
+            "Shortage_Count": aged_years["Aged_Shortage_Count"].astype(int),
+            "Total_Invoice_USD": aged_years["Aged_Invoice_USD"].round(settings.round_decimals),
+            "Total_Shortage_USD": aged_years["Aged_Amount_USD"].round(settings.round_decimals),
+        }
+    ).reset_index(drop=True)
 
     LOGGER.info("Computed %d KPI tables", 4)
 
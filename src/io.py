@@ -4,12 +4,19 @@ from __future__ import annotations
 
 import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, Iterable, List, Tuple
+from typing import Callable, Dict, Iterable, List, Tuple
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as pads
+import pyarrow.parquet as pq
 
-from .utils import SettingsConfig, ensure_directories
+from .utils import SettingsConfig, currency_compliant, ensure_directories, forget_directories
 
 
 LOGGER = logging.getLogger(__name__)
@@ -75,10 +82,27 @@ STRING_COLUMNS: Tuple[str, ...] = (
 
 BOOL_COLUMNS: Tuple[str, ...] = ("Any Deductions",)
 
+# Optional amounts are coerced (bad values become null) rather than failing the file.
+COERCED_FLOAT_COLUMNS: Tuple[str, ...] = tuple(
+    column for column in FLOAT_COLUMNS if column not in REQUIRED_COLUMNS
+)
+# Accepts what pd.to_numeric did: decimals, exponents, inf/infinity and nan (any case).
+# Thousands separators and other formatting are rejected and become null.
+NUMERIC_PATTERN = r"^[+-]?((\d+\.?\d*|\.\d+)(e[+-]?\d+)?|inf(inity)?|nan)$"
+# Tried in order after the configured day/month format; unparseable dates become null.
+ISO_DATE_FORMATS: Tuple[str, ...] = ("%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S")
+
 
 TRUE_VALUES = {"true", "t", "yes", "y", "1", "on"}
 FALSE_VALUES = {"false", "f", "no", "n", "0", "off"}
 
+CSV_BLOCK_SIZE = 64 << 20
+# Arrow already parses each file on multiple threads; keep file-level fan-out small.
+MAX_READ_WORKERS = 4
+PARQUET_COMPRESSION = "zstd"
+PARQUET_COMPRESSION_LEVEL = 3
+PARQUET_ROW_GROUP_SIZE = 256 * 1024
+
 
 def read_invoice_data(settings: SettingsConfig) -> pd.DataFrame:
     """Read and combine invoice CSV files from the configured raw directory."""
@@ -92,13 +116,19 @@ def read_invoice_data(settings: SettingsConfig) -> pd.DataFrame:
         raise FileNotFoundError(f"No CSV files found in {source_dir}")
 
     LOGGER.info("Found %d raw CSV files in %s", len(csv_files), source_dir)
-    frames: List[pd.DataFrame] = []
-    for file_path in csv_files:
-        frames.append(_load_single_file(file_path, settings))
-
-    combined = pd.concat(frames, ignore_index=True)
-    LOGGER.info("Combined %d rows from %d files", combined.shape[0], len(frames))
-    return combined
+    load_file = partial(_load_single_file, settings=settings)
+    with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(csv_files))) as executor:
+        tables: List[pa.Table] = list(executor.map(load_file, csv_files))
+
+    # Concatenating tables only stitches chunks together; pandas conversion happens once.
+    combined = pa.concat_tables(tables, promote_options="default")
+    df = combined.to_pandas(
+        types_mapper={pa.string(): pd.StringDtype()}.get,
+        split_blocks=True,
+        self_destruct=True,
+    )
+    LOGGER.info("Combined %d rows from %d files", df.shape[0], len(tables))
+    return df
 
 
 def write_partitioned_parquet(
@@ -109,23 +139,64 @@ def write_partitioned_parquet(
     """Write a DataFrame to Parquet partitioned by ``partition_col``."""
 
     # Placeholder for future S3/object-storage integration; currently local filesystem only.
-    ensure_directories(output_path.parent)
     if output_path.exists():
         if output_path.is_dir():
             shutil.rmtree(output_path)
         else:
             output_path.unlink()
 
-    df.to_parquet(output_path, partition_cols=[partition_col], engine="pyarrow", index=False)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    parquet_format = pads.ParquetFileFormat()
+    write = partial(
+        pads.write_dataset,
+        table,
+        output_path,
+        format=parquet_format,
+        file_options=parquet_format.make_write_options(
+            compression=PARQUET_COMPRESSION,
+            compression_level=PARQUET_COMPRESSION_LEVEL,
+            write_statistics=True,
+            use_dictionary=True,
+        ),
+        partitioning=pads.partitioning(
+            pa.schema([table.schema.field(partition_col)]), flavor="hive"
+        ),
+        max_rows_per_group=PARQUET_ROW_GROUP_SIZE,
+    )
+    _write_with_parent(output_path, write)
     LOGGER.info("Wrote Parquet dataset partitioned by %s to %s", partition_col, output_path)
     return output_path
 
 
+def read_parquet(path: Path) -> pd.DataFrame:
+    """Read a Parquet file written by ``write_parquet`` back into a DataFrame."""
+
+    # pre_buffer coalesces column chunk reads; self_destruct frees Arrow buffers
+    # as they are converted so the table and frame are not both held in full.
+    table = pq.read_table(path, pre_buffer=True, use_threads=True)
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    LOGGER.info("Read Parquet file from %s", path)
+    return df
+
+
 def write_parquet(df: pd.DataFrame, output_path: Path) -> Path:
     """Write a DataFrame to a Parquet file."""
 
-    ensure_directories(output_path.parent)
-    df.to_parquet(output_path, engine="pyarrow", index=False)
+    return write_parquet_table(pa.Table.from_pandas(df, preserve_index=False), output_path)
+
+
+def write_parquet_table(table: pa.Table, output_path: Path) -> Path:
+    """Write an Arrow table to a Parquet file."""
+
+    write = partial(
+        pq.write_table,
+        table,
+        output_path,
+        compression=PARQUET_COMPRESSION,
+        compression_level=PARQUET_COMPRESSION_LEVEL,
+        row_group_size=PARQUET_ROW_GROUP_SIZE,
+    )
+    _write_with_parent(output_path, write)
     LOGGER.info("Wrote Parquet file to %s", output_path)
     return output_path
 
@@ -133,83 +204,132 @@ def write_parquet(df: pd.DataFrame, output_path: Path) -> Path:
 def write_csv(df: pd.DataFrame, output_path: Path) -> Path:
     """Write a DataFrame to CSV."""
 
-    ensure_directories(output_path.parent)
-    df.to_csv(output_path, index=False)
+    # The CSV outputs are small KPI tables; pandas keeps their published format.
+    _write_with_parent(output_path, partial(df.to_csv, output_path, index=False))
     LOGGER.info("Wrote CSV file to %s", output_path)
     return output_path
 
 
-def _load_single_file(file_path: Path, settings: SettingsConfig) -> pd.DataFrame:
+def _write_with_parent(output_path: Path, write: Callable[[], object]) -> None:
+    """Ensure the parent directory of ``output_path`` exists, then call ``write``."""
+
+    ensure_directories(output_path.parent)
+    try:
+        write()
+    except OSError:
+        if output_path.parent.is_dir():
+            raise
+        # The cached parent was removed since it was first ensured; recreate it once.
+        forget_directories(output_path.parent)
+        ensure_directories(output_path.parent)
+        write()
+
+
+def _load_single_file(file_path: Path, settings: SettingsConfig) -> pa.Table:
     """Load and clean a single CSV file."""
 
     LOGGER.info("Reading CSV file %s", file_path)
-    dtype_map = _dtype_mapping()
-    dayfirst = settings.date_format.lower() in {"dayfirst", "dd/mm/yyyy"}
-    df = pd.read_csv(
-        file_path,
-        dtype=dtype_map,
-        parse_dates=list(DATE_COLUMNS),
-        dayfirst=dayfirst,
-        keep_default_na=True,
-    )
+    try:
+        table = pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE),
+            parse_options=pacsv.ParseOptions(),
+            convert_options=_convert_options(),
+        )
+    except pa.ArrowInvalid as exc:
+        raise ValueError(f"Failed to parse CSV file {file_path}: {exc}") from exc
 
-    df.columns = [column.strip() for column in df.columns]
-    _assert_required_columns(df.columns)
-    _add_missing_optional_columns(df)
+    table = table.rename_columns([column.strip() for column in table.column_names])
+    _assert_required_columns(table.column_names)
+    table = _add_missing_optional_columns(table)
 
+    date_formats = _date_formats(settings)
     for column in DATE_COLUMNS:
-        df[column] = pd.to_datetime(df[column], errors="coerce", dayfirst=dayfirst).dt.date
+        table = _replace_column(
+            table, column, _to_timestamp(table.column(column), date_formats)
+        )
+
+    for column in COERCED_FLOAT_COLUMNS:
+        table = _replace_column(table, column, _to_float(table.column(column)))
 
     for column in FLOAT_COLUMNS:
-        if column in df.columns:
-            df[column] = pd.to_numeric(df[column], errors="coerce").round(settings.round_decimals)
+        table = _replace_column(
+            table, column, pc.round(table.column(column), ndigits=settings.round_decimals)
+        )
 
     for column in STRING_COLUMNS:
-        if column in df.columns:
-            df[column] = df[column].astype("string").str.strip()
+        table = _replace_column(table, column, pc.utf8_trim_whitespace(table.column(column)))
 
     for column in BOOL_COLUMNS:
-        df[column] = df[column].apply(_to_bool)
+        table = _replace_column(table, column, _to_bool(table.column(column)))
 
-    df = _filter_currency(df, settings.currency_expected)
-    if df.empty:
+    table = _filter_currency(table, settings.currency_expected)
+    if table.num_rows == 0:
         LOGGER.warning(
             "All rows filtered out from %s due to currency checks (expected %s)",
             file_path.name,
             settings.currency_expected,
         )
-    df["Source_File"] = file_path.name
-    ordered_columns = list(EXPECTED_COLUMNS) + ["Source_File"]
-    df = df[ordered_columns]
-    return df
+    source_file = pc.fill_null(pa.nulls(table.num_rows, pa.string()), file_path.name)
+    table = table.append_column("Source_File", source_file)
+    return table.select(list(EXPECTED_COLUMNS) + ["Source_File"])
+
+
+def _replace_column(table: pa.Table, column: str, values: pa.ChunkedArray) -> pa.Table:
+    """Return ``table`` with ``column`` replaced by ``values``."""
+
+    return table.set_column(table.schema.get_field_index(column), column, values)
 
 
-def _filter_currency(df: pd.DataFrame, expected_currency: str) -> pd.DataFrame:
+def _filter_currency(table: pa.Table, expected_currency: str) -> pa.Table:
     """Filter rows by currency and warn about non-compliant records."""
 
-    mask_paid = df["Paid Amount Currency"].str.upper() == expected_currency.upper()
-    mask_invoice = df["Invoice Currency"].str.upper() == expected_currency.upper()
-    compliant_mask = mask_paid & mask_invoice
-    non_compliant = df[~compliant_mask]
-    if not non_compliant.empty:
+    compliant_mask = currency_compliant(
+        table.column("Paid Amount Currency"),
+        table.column("Invoice Currency"),
+        expected_currency,
+    )
+    non_compliant_count = table.num_rows - pc.sum(compliant_mask, min_count=0).as_py()
+    if non_compliant_count:
         LOGGER.warning(
             "Skipping %d rows due to non-%s currency values",
-            non_compliant.shape[0],
+            non_compliant_count,
             expected_currency,
         )
-    return df[compliant_mask].reset_index(drop=True)
+    return table.filter(compliant_mask)
+
+
+def _convert_options() -> pacsv.ConvertOptions:
+    """Return the Arrow conversion options for CSV ingestion."""
 
+    return pacsv.ConvertOptions(column_types=_column_types(), strings_can_be_null=True)
 
-def _dtype_mapping() -> Dict[str, str]:
-    """Return the dtype mapping for CSV ingestion."""
 
-    dtype_map: Dict[str, str] = {}
+def _date_formats(settings: SettingsConfig) -> Tuple[str, ...]:
+    """Return the date formats tried, in order, when parsing date columns."""
+
+    dayfirst = settings.date_format.lower() in {"dayfirst", "dd/mm/yyyy"}
+    return ("%d/%m/%Y" if dayfirst else "%m/%d/%Y",) + ISO_DATE_FORMATS
+
+
+def _column_types() -> Dict[str, pa.DataType]:
+    """Return the Arrow type of every expected column."""
+
+    column_types: Dict[str, pa.DataType] = {}
     for column in STRING_COLUMNS:
-        dtype_map[column] = "string"
+        column_types[column] = pa.string()
+    for column in FLOAT_COLUMNS:
+        column_types[column] = pa.float64()
+    # Coerced amounts are read as strings and converted by ``_to_float``.
+    for column in COERCED_FLOAT_COLUMNS:
+        column_types[column] = pa.string()
+    # Booleans are read as strings and normalised by ``_to_bool``.
     for column in BOOL_COLUMNS:
-        dtype_map[column] = "string"
-    # Floats handled post-read to allow coercion.
-    return dtype_map
+        column_types[column] = pa.string()
+    # Dates are read as strings and parsed by ``_to_timestamp``.
+    for column in DATE_COLUMNS:
+        column_types[column] = pa.string()
+    return column_types
 
 
 def _assert_required_columns(columns: Iterable[str]) -> None:
@@ -220,24 +340,47 @@ def _assert_required_columns(columns: Iterable[str]) -> None:
         raise ValueError(f"Missing required columns: {missing}")
 
 
-def _add_missing_optional_columns(df: pd.DataFrame) -> None:
-    """Add optional columns as NA to simplify downstream processing."""
+def _add_missing_optional_columns(table: pa.Table) -> pa.Table:
+    """Add optional columns as typed nulls to simplify downstream processing."""
 
+    column_types = _column_types()
     for column in EXPECTED_COLUMNS:
-        if column not in df.columns:
-            df[column] = pd.NA
+        if column not in table.column_names:
+            table = table.append_column(
+                column, pa.nulls(table.num_rows, column_types[column])
+            )
+    return table
 
 
-def _to_bool(value: object) -> bool:
-    """Convert a value to boolean."""
+def _to_bool(values: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Convert a column of boolean tokens to booleans."""
 
-    if isinstance(value, bool):
-        return value
-    if pd.isna(value):
+    if values.null_count:
         raise ValueError("Encountered missing value in required boolean column.")
-    normalized = str(value).strip().lower()
-    if normalized in TRUE_VALUES:
-        return True
-    if normalized in FALSE_VALUES:
-        return False
-    raise ValueError(f"Cannot convert value '{value}' to boolean.")
+    normalized = pc.utf8_lower(pc.utf8_trim_whitespace(values))
+    is_true = pc.is_in(normalized, value_set=pa.array(sorted(TRUE_VALUES)))
+    is_false = pc.is_in(normalized, value_set=pa.array(sorted(FALSE_VALUES)))
+    invalid = pc.invert(pc.or_(is_true, is_false))
+    if pc.any(invalid).as_py():
+        raise ValueError(f"Cannot convert value '{values.filter(invalid)[0]}' to boolean.")
+    return is_true
+
+
+def _to_float(values: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Convert numeric strings to floats, nulling values that do not parse."""
+
+    trimmed = pc.utf8_trim_whitespace(values)
+    is_numeric = pc.match_substring_regex(trimmed, NUMERIC_PATTERN, ignore_case=True)
+    numeric = pc.if_else(is_numeric, trimmed, pa.scalar(None, pa.string()))
+    return pc.cast(numeric, pa.float64())
+
+
+def _to_timestamp(values: pa.ChunkedArray, formats: Iterable[str]) -> pa.ChunkedArray:
+    """Parse date strings with the first matching format, nulling values that do not parse."""
+
+    trimmed = pc.utf8_trim_whitespace(values)
+    parsed = pc.coalesce(
+        *(pc.strptime(trimmed, format=fmt, unit="ns", error_is_null=True) for fmt in formats)
+    )
+    # Only the calendar date is kept, as the pandas loader did with ``.dt.date``.
+    return pc.floor_temporal(parsed, unit="day")
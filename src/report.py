@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Dict
 
 import pandas as pd
+import pyarrow as pa
 
 from . import io
 from .utils import SettingsConfig
@@ -31,9 +32,11 @@ def export_shortage_outputs(df: pd.DataFrame, settings: SettingsConfig) -> Dict[
     flagged_path = settings.output_processed_dir / "shortages_flagged.parquet"
     shortages_only = settings.output_processed_dir / "shortages_only.parquet"
 
-    io.write_parquet(df, flagged_path)
-    shortage_records = df[df["Shortage_Flag"]]
-    io.write_parquet(shortage_records, shortages_only)
+    # Convert once; the shortage subset is an Arrow filter over the same buffers.
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    io.write_parquet_table(table, flagged_path)
+    shortage_mask = pa.array(df["Shortage_Flag"].to_numpy(dtype=bool))
+    io.write_parquet_table(table.filter(shortage_mask), shortages_only)
 
     return {
         "shortages_flagged": flagged_path,
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import logging
 from datetime import date
+from typing import FrozenSet, Tuple
 
+import numpy as np
 import pandas as pd
 
 from .utils import RulesConfig, SettingsConfig
@@ -12,6 +14,9 @@ from .utils import RulesConfig, SettingsConfig
 
 LOGGER = logging.getLogger(__name__)
 
+NAT_NS = np.iinfo(np.int64).min
+NS_PER_DAY = 86_400_000_000_000
+
 
 def apply_shortage_logic(
     df: pd.DataFrame,
@@ -21,35 +26,65 @@ def apply_shortage_logic(
     """Flag invoice shortages based on configured tolerance and rules."""
 
     LOGGER.info("Applying shortage logic")
-    working = df.copy()
-
-    tolerance = settings.tolerance_small_delta_usd
-    normalized_status = working["Invoice Status"].astype("string").str.upper()
-    allowed_statuses = set(rules.eligible_statuses)
-
-    shortage_condition = (
-        (working["Invoice_Delta"] > tolerance)
-        & (
-            working["Any Deductions"].astype(bool)
-            | working["Child_Invoice_Present"].astype(bool)
-        )
-        & normalized_status.isin(allowed_statuses)
-    )
 
-    working["Shortage_Flag"] = shortage_condition
-    working["Shortage_Amount_USD"] = working["Invoice_Delta"].where(shortage_condition, 0.0)
+    due_ns = df["Payment Due Date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+    today_ns = pd.Timestamp(date.today()).as_unit("ns").value
 
-    payment_due = pd.to_datetime(working["Payment Due Date"], dayfirst=True, errors="coerce")
-    today_value = pd.Timestamp(date.today())
-    working["Days_Past_Due"] = (today_value - payment_due).dt.days
-    working["Days_Past_Due"] = working["Days_Past_Due"].clip(lower=0).fillna(0).astype(int)
+    flag, amount, days_past_due, aged = _evaluate_shortages(
+        df["Invoice_Delta"].to_numpy(dtype=np.float64),
+        df["Any Deductions"].to_numpy(dtype=bool),
+        df["Child_Invoice_Present"].to_numpy(dtype=bool),
+        _eligible_status_mask(df["Invoice Status"], rules.eligible_statuses),
+        due_ns,
+        settings.tolerance_small_delta_usd,
+        today_ns,
+        settings.aging_days_threshold,
+    )
 
-    working["Age_Bucket"] = working["Days_Past_Due"].apply(
-        lambda days: "Aged" if days > settings.aging_days_threshold else "Current"
+    LOGGER.info("Shortage logic flagged %d records", flag.sum())
+    return df.assign(
+        Shortage_Flag=flag,
+        Shortage_Amount_USD=amount,
+        Days_Past_Due=days_past_due,
+        Age_Bucket=np.where(aged, "Aged", "Current"),
     )
 
-    LOGGER.info(
-        "Shortage logic flagged %d records",
-        working["Shortage_Flag"].sum(),
+
+def _eligible_status_mask(statuses: pd.Series, eligible_statuses: FrozenSet[str]) -> np.ndarray:
+    """Return a boolean mask of rows whose status is eligible, ignoring case.
+
+    Statuses are categorically encoded so only the distinct values are
+    upper-cased and compared; missing statuses are never eligible.
+    """
+
+    codes, categories = pd.factorize(statuses)
+    category_allowed = np.array(
+        [str(category).upper() in eligible_statuses for category in categories] + [False],
+        dtype=bool,
     )
-    return working
+    # Missing values are coded -1 and therefore pick the trailing False.
+    return category_allowed[codes]
+
+
+def _evaluate_shortages(
+    invoice_delta: np.ndarray,
+    any_deductions: np.ndarray,
+    child_present: np.ndarray,
+    status_allowed: np.ndarray,
+    due_ns: np.ndarray,
+    tolerance: float,
+    today_ns: int,
+    aging_threshold: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Evaluate shortage flags, amounts and ageing over raw NumPy arrays.
+
+    ``due_ns`` holds nanoseconds since the epoch with ``NAT_NS`` marking
+    missing dates, which are treated as not past due.
+    """
+
+    flag = (invoice_delta > tolerance) & (any_deductions | child_present) & status_allowed
+    amount = np.where(flag, invoice_delta, 0.0)
+    elapsed_days = (today_ns - due_ns) // NS_PER_DAY
+    days_past_due = np.where(due_ns == NAT_NS, 0, np.maximum(elapsed_days, 0))
+    aged = days_past_due > aging_threshold
+    return flag, amount, days_past_due, aged
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import logging
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from .utils import SettingsConfig
 
@@ -16,25 +19,31 @@ def transform_invoices(df: pd.DataFrame, settings: SettingsConfig) -> pd.DataFra
     """Apply core transformations required downstream."""
 
     LOGGER.info("Starting transformation step")
-    working = df.copy()
 
-    working["Invoice Amount"] = working["Invoice Amount"].fillna(0.0)
-    working["Actual Paid Amount"] = working["Actual Paid Amount"].fillna(0.0)
-    working["Invoice_Delta"] = (
-        working["Invoice Amount"] - working["Actual Paid Amount"]
-    ).round(settings.round_decimals)
+    invoice_amount = df["Invoice Amount"].fillna(0.0)
+    paid_amount = df["Actual Paid Amount"].fillna(0.0)
+    invoice_delta = (invoice_amount - paid_amount).round(settings.round_decimals)
 
-    child_series = working["Randomized Latest Child Invoice"].astype("string")
-    working["Child_Invoice_Present"] = (
-        child_series.str.strip().fillna("").ne("").astype(bool)
+    child_invoice = pa.array(df["Randomized Latest Child Invoice"], type=pa.string())
+    child_length = pc.utf8_length(pc.utf8_trim_whitespace(child_invoice))
+    child_present = pc.fill_null(pc.greater(child_length, 0), False).to_numpy(
+        zero_copy_only=False
     )
 
-    payment_due = pd.to_datetime(
-        working["Payment Due Date"],
-        errors="coerce",
-        dayfirst=settings.date_format.lower() in {"dayfirst", "dd/mm/yyyy"},
+    payment_due = df["Payment Due Date"].to_numpy(dtype="datetime64[ns]")
+    years_since_epoch = payment_due.astype("datetime64[Y]").astype(np.int64)
+    payment_year = pd.arrays.IntegerArray(years_since_epoch + 1970, np.isnat(payment_due))
+
+    # assign() returns a new frame and leaves the caller's input unmodified.
+    transformed = df.assign(
+        **{
+            "Invoice Amount": invoice_amount,
+            "Actual Paid Amount": paid_amount,
+            "Invoice_Delta": invoice_delta,
+            "Child_Invoice_Present": child_present,
+            "Payment_Year": payment_year,
+        }
     )
-    working["Payment_Year"] = payment_due.dt.year.astype("Int64")
 
     LOGGER.info("Completed transformation")
-    return working
+    return transformed
@@ -4,14 +4,27 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, Set, Union
 
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml bindings unavailable
+    from yaml import SafeLoader
+
 
 LOGGER = logging.getLogger(__name__)
 
+# Directories already created by this process; lets repeated writes skip the mkdir.
+_ENSURED_DIRECTORIES: Set[Path] = set()
+
 
 @dataclass(frozen=True)
 class SettingsConfig:
@@ -29,12 +42,22 @@ class SettingsConfig:
 
 @dataclass(frozen=True)
 class RulesConfig:
-    """Typed representation of values stored in ``config/rules.yaml``."""
+    """Typed representation of values stored in ``config/rules.yaml``.
 
-    eligible_statuses: List[str]
-    shortage_required_flags: List[str]
+    Status and flag collections are stored as frozensets so membership tests
+    are constant time; any iterable passed in is normalised on construction.
+    """
+
+    eligible_statuses: FrozenSet[str]
+    shortage_required_flags: FrozenSet[str]
     use_strict_currency_check: bool
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "eligible_statuses", frozenset(self.eligible_statuses))
+        object.__setattr__(
+            self, "shortage_required_flags", frozenset(self.shortage_required_flags)
+        )
+
 
 def configure_logging(level: int = logging.INFO) -> None:
     """Configure root logging with a structured format once per process."""
@@ -52,7 +75,7 @@ def load_yaml(path: Path) -> Dict[str, Any]:
         raise FileNotFoundError(f"Configuration file not found: {path}")
 
     with path.open("r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
+        data = yaml.load(handle, Loader=SafeLoader) or {}
     LOGGER.debug("Loaded YAML configuration from %s", path)
     if not isinstance(data, dict):
         raise ValueError(f"Unexpected YAML structure in {path}")
@@ -60,7 +83,18 @@ def load_yaml(path: Path) -> Dict[str, Any]:
 
 
 def load_settings(path: Path) -> SettingsConfig:
-    """Parse the settings configuration file into ``SettingsConfig``."""
+    """Parse the settings configuration file into ``SettingsConfig``.
+
+    Results are cached per path and modification time, so repeated calls
+    only re-parse the file after it changes.
+    """
+
+    return _load_settings_cached(path, _modified_time_ns(path))
+
+
+@lru_cache(maxsize=8)
+def _load_settings_cached(path: Path, mtime_ns: int) -> SettingsConfig:
+    """Parse ``path`` into ``SettingsConfig``; ``mtime_ns`` only keys the cache."""
 
     raw = load_yaml(path)
     settings = SettingsConfig(
@@ -78,29 +112,93 @@ def load_settings(path: Path) -> SettingsConfig:
 
 
 def load_rules(path: Path) -> RulesConfig:
-    """Parse the rules configuration file into ``RulesConfig``."""
+    """Parse the rules configuration file into ``RulesConfig``.
+
+    Results are cached per path and modification time like ``load_settings``.
+    """
+
+    return _load_rules_cached(path, _modified_time_ns(path))
+
+
+@lru_cache(maxsize=8)
+def _load_rules_cached(path: Path, mtime_ns: int) -> RulesConfig:
+    """Parse ``path`` into ``RulesConfig``; ``mtime_ns`` only keys the cache."""
 
     raw = load_yaml(path)
     rules = RulesConfig(
-        eligible_statuses=[str(status).upper() for status in raw["eligible_statuses"]],
-        shortage_required_flags=[str(flag) for flag in raw["shortage_required_flags"]],
+        eligible_statuses=frozenset(str(status).upper() for status in raw["eligible_statuses"]),
+        shortage_required_flags=frozenset(str(flag) for flag in raw["shortage_required_flags"]),
         use_strict_currency_check=bool(raw["use_strict_currency_check"]),
     )
     LOGGER.debug("Parsed rules: %s", rules)
     return rules
 
 
+def _modified_time_ns(path: Path) -> int:
+    """Return the modification time of a configuration file."""
+
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"Configuration file not found: {path}") from exc
+
+
 def ensure_directories(*paths: Path) -> None:
-    """Create directories if they do not exist."""
+    """Create directories if they do not exist.
+
+    Each directory is created at most once per process; later calls for the
+    same path return without touching the filesystem. Use
+    ``forget_directories`` if a directory may have been removed since.
+    """
 
     for path in paths:
         if path is None:
             continue
         resolved_path = Path(path)
+        if resolved_path in _ENSURED_DIRECTORIES:
+            continue
         resolved_path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRECTORIES.add(resolved_path)
         LOGGER.debug("Ensured directory exists: %s", resolved_path)
 
 
+def forget_directories(*paths: Path) -> None:
+    """Drop directories from the ``ensure_directories`` cache."""
+
+    for path in paths:
+        if path is not None:
+            _ENSURED_DIRECTORIES.discard(Path(path))
+
+
+def currency_compliant_mask(df: pd.DataFrame, expected_currency: str) -> np.ndarray:
+    """Return a boolean mask of rows whose paid and invoice currencies match.
+
+    Comparison is case-insensitive; missing currencies are non-compliant.
+    """
+
+    compliant = currency_compliant(
+        pa.array(df["Paid Amount Currency"], type=pa.string()),
+        pa.array(df["Invoice Currency"], type=pa.string()),
+        expected_currency,
+    )
+    return compliant.to_numpy(zero_copy_only=False)
+
+
+def currency_compliant(
+    paid_currency: Union[pa.Array, pa.ChunkedArray],
+    invoice_currency: Union[pa.Array, pa.ChunkedArray],
+    expected_currency: str,
+) -> Union[pa.Array, pa.ChunkedArray]:
+    """Compare both Arrow currency arrays against ``expected_currency``."""
+
+    expected_upper = expected_currency.upper()
+    matches = [
+        pc.equal(pc.utf8_upper(currency), expected_upper)
+        for currency in (paid_currency, invoice_currency)
+    ]
+    return pc.fill_null(pc.and_(*matches), False)
+
+
 def _resolve_path(base: Path, relative: str) -> Path:
     """Resolve a repository-relative path."""
 
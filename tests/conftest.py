@@ -0,0 +1,80 @@
+"""Shared fixtures for the test suite."""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils import RulesConfig, SettingsConfig
+
+
+_TODAY_DATE = date.today()
+_TODAY_NS = np.datetime64(_TODAY_DATE, "ns")
+_PAYMENT_DUE = _TODAY_NS - np.timedelta64(5, "D")
+_INVOICE_CREATED = _TODAY_NS - np.timedelta64(10, "D")
+
+
+@pytest.fixture(scope="session")
+def settings() -> SettingsConfig:
+    return SettingsConfig(
+        input_raw_dir=Path("data/raw"),
+        output_processed_dir=Path("data/processed"),
+        date_format="dayfirst",
+        aging_days_threshold=90,
+        currency_expected="USD",
+        round_decimals=2,
+        partition_by_year=True,
+        tolerance_small_delta_usd=0.01,
+    )
+
+
+@pytest.fixture(scope="session")
+def rules() -> RulesConfig:
+    return RulesConfig(
+        eligible_statuses=frozenset(
+            {
+                "PAID",
+                "PAID_PRICE_DISCREPANCY",
+                "PROCESSING_PENDING_AMAZON_ACTION",
+                "QUEUED_FOR_PAYMENT",
+            }
+        ),
+        shortage_required_flags=frozenset({"Any Deductions", "Child_Invoice_Present"}),
+        use_strict_currency_check=True,
+    )
+
+
+@pytest.fixture(scope="session")
+def valid_invoice_row_template() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Invoice Date": np.array([_TODAY_NS], dtype="datetime64[ns]"),
+            "Payment Due Date": np.array([_PAYMENT_DUE], dtype="datetime64[ns]"),
+            "Invoice Status": pd.array(["PAID"], dtype="string"),
+            "Actual Paid Amount": np.array([95.0], dtype=np.float64),
+            "Paid Amount Currency": pd.array(["USD"], dtype="string"),
+            "Invoice Creation Date": np.array([_INVOICE_CREATED], dtype="datetime64[ns]"),
+            "Randomized Invoice": pd.array(["INV-001"], dtype="string"),
+            "Invoice Amount": np.array([100.0], dtype=np.float64),
+            "Invoice Currency": pd.array(["USD"], dtype="string"),
+            "Any Deductions": np.array([True], dtype=bool),
+            "Randomized PO": pd.array(["PO-123"], dtype="string"),
+            "Invoice_Delta": np.array([5.0], dtype=np.float64),
+            "Child_Invoice_Present": np.array([False], dtype=bool),
+            "Payment_Year": np.array([_TODAY_DATE.year], dtype=np.int64),
+            "Shortage_Flag": np.array([True], dtype=bool),
+            "Shortage_Amount_USD": np.array([5.0], dtype=np.float64),
+            "Days_Past_Due": np.array([5], dtype=np.int64),
+            "Age_Bucket": pd.array(["Current"], dtype="string"),
+        }
+    )
+
+
+@pytest.fixture
+def valid_invoice_row(valid_invoice_row_template: pd.DataFrame) -> pd.DataFrame:
+    # Deep copy: without copy-on-write a shallow copy would let mutations leak into the template.
+    return valid_invoice_row_template.copy()
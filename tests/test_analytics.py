@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from datetime import date
-from pathlib import Path
 
 import pandas as pd
 
@@ -11,20 +10,7 @@ from src.analytics import compute_kpis
 from src.utils import SettingsConfig
 
 
-def _settings() -> SettingsConfig:
-    return SettingsConfig(
-        input_raw_dir=Path("data/raw"),
-        output_processed_dir=Path("data/processed"),
-        date_format="dayfirst",
-        aging_days_threshold=90,
-        currency_expected="USD",
-        round_decimals=2,
-        partition_by_year=True,
-        tolerance_small_delta_usd=0.01,
-    )
-
-
-def test_compute_kpis_produces_aged_invoice_summary() -> None:
+def test_compute_kpis_produces_aged_invoice_summary(settings: SettingsConfig) -> None:
     df = pd.DataFrame(
         {
             "Payment_Year": [2023, 2024],
@@ -36,8 +22,63 @@ def test_compute_kpis_produces_aged_invoice_summary() -> None:
         }
     )
 
-    tables = compute_kpis(df, _settings())
+    tables = compute_kpis(df, settings)
     aged_invoices = tables["aged_invoices_by_year"]
 
     assert not aged_invoices.empty
     assert set(aged_invoices["Payment_Year"]) == {2023, 2024}
+
+
+def test_compute_kpis_tables_match_expected_values(settings: SettingsConfig) -> None:
+    df = pd.DataFrame(
+        {
+            # 2023 has an aged shortage, a current shortage and an aged non-shortage;
+            # 2024 has no shortages; the null-year shortage only counts in the total.
+            "Payment_Year": pd.array([2023, 2023, 2023, 2024, None], dtype="Int64"),
+            "Shortage_Flag": [True, True, False, False, True],
+            "Shortage_Amount_USD": [10.0, 20.5, 0.0, 0.0, 5.0],
+            "Invoice Amount": [110.0, 200.0, 50.0, 120.0, 60.0],
+            "Randomized Invoice": ["INV-1", "INV-2", "INV-3", "INV-4", "INV-5"],
+            "Age_Bucket": ["Aged", "Current", "Aged", "Aged", "Aged"],
+        }
+    )
+
+    tables = compute_kpis(df, settings)
+
+    pd.testing.assert_frame_equal(
+        tables["total_shortage"],
+        pd.DataFrame({"Shortage_Count": [3], "Total_Shortage_USD": [35.5]}),
+    )
+    pd.testing.assert_frame_equal(
+        tables["annual_shortages"],
+        pd.DataFrame(
+            {
+                "Payment_Year": pd.array([2023], dtype="Int64"),
+                "Shortage_Count": [2],
+                "Total_Shortage_USD": [30.5],
+                "Mean_Shortage_USD": [15.25],
+            }
+        ),
+    )
+    pd.testing.assert_frame_equal(
+        tables["aged_shortages_by_year"],
+        pd.DataFrame(
+            {
+                "Payment_Year": pd.array([2023], dtype="Int64"),
+                "Shortage_Count": [1],
+                "Total_Shortage_USD": [10.0],
+            }
+        ),
+    )
+    pd.testing.assert_frame_equal(
+        tables["aged_invoices_by_year"],
+        pd.DataFrame(
+            {
+                "Payment_Year": pd.array([2023, 2024], dtype="Int64"),
+                "Invoice_Count": [2, 1],
+                "Shortage_Count": [1, 0],
+                "Total_Invoice_USD": [160.0, 120.0],
+                "Total_Shortage_USD": [10.0, 0.0],
+            }
+        ),
+    )
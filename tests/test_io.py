@@ -0,0 +1,166 @@
+"""Tests for CSV ingestion in src.io."""
+
+from __future__ import annotations
+
+import csv
+import shutil
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+from src.io import EXPECTED_COLUMNS, read_invoice_data, read_parquet, write_csv, write_parquet
+from src.utils import SettingsConfig
+
+
+def _row(**overrides: str) -> Dict[str, str]:
+    row = {
+        "Marketplace": "US",
+        "Invoice Date": "08/07/2021",
+        "Payment Due Date": "14/08/2023",
+        "Invoice Status": "PAID",
+        "Actual Paid Amount": "100.0",
+        "Paid Amount Currency": "USD",
+        "Payee": "ABCDE",
+        "Invoice Creation Date": "08/07/2021",
+        "Randomized Invoice": "INV-001",
+        "Invoice Amount": "105.0",
+        "Invoice Currency": "USD",
+        "Any Deductions": "FALSE",
+        "Quantity Variance Amount": "0",
+        "Price Variance Amount": "0",
+        "Quick Pay Discount Amount": "2.11",
+        "Randomized Latest Child Invoice": "",
+        "Randomized PO": "PO-123",
+    }
+    row.update(overrides)
+    return row
+
+
+def _write_csv(
+    path: Path, rows: List[Dict[str, str]], columns: Iterable[str] = EXPECTED_COLUMNS
+) -> None:
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(columns), extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def test_header_only_file_is_skipped(tmp_path: Path, settings: SettingsConfig) -> None:
+    _write_csv(tmp_path / "a_invoices.csv", [_row()])
+    _write_csv(tmp_path / "b_empty_export.csv", [])
+
+    df = read_invoice_data(replace(settings, input_raw_dir=tmp_path))
+
+    assert df.shape[0] == 1
+    assert df.loc[0, "Source_File"] == "a_invoices.csv"
+
+
+def test_bool_tokens_ignore_case_and_whitespace(
+    tmp_path: Path, settings: SettingsConfig
+) -> None:
+    rows = [_row(**{"Any Deductions": token}) for token in (" yes ", "0", "True", "OFF")]
+    _write_csv(tmp_path / "invoices.csv", rows)
+
+    df = read_invoice_data(replace(settings, input_raw_dir=tmp_path))
+
+    np.testing.assert_array_equal(
+        df["Any Deductions"].to_numpy(), np.array([True, False, True, False])
+    )
+
+
+def test_currency_filter_is_case_insensitive(tmp_path: Path, settings: SettingsConfig) -> None:
+    rows = [
+        _row(**{"Randomized Invoice": "INV-1", "Paid Amount Currency": "usd"}),
+        _row(**{"Randomized Invoice": "INV-2", "Invoice Currency": "EUR"}),
+    ]
+    _write_csv(tmp_path / "invoices.csv", rows)
+
+    df = read_invoice_data(replace(settings, input_raw_dir=tmp_path))
+
+    assert df["Randomized Invoice"].tolist() == ["INV-1"]
+
+
+def test_missing_optional_column_is_added_as_null(
+    tmp_path: Path, settings: SettingsConfig
+) -> None:
+    columns = [column for column in EXPECTED_COLUMNS if column != "Payee"]
+    _write_csv(tmp_path / "invoices.csv", [_row()], columns=columns)
+
+    df = read_invoice_data(replace(settings, input_raw_dir=tmp_path))
+
+    assert list(df.columns) == list(EXPECTED_COLUMNS) + ["Source_File"]
+    assert df["Payee"].isna().all()
+
+
+def test_invalid_optional_amounts_are_coerced_to_null(
+    tmp_path: Path, settings: SettingsConfig
+) -> None:
+    rows = [
+        _row(**{"Quantity Variance Amount": "abc"}),
+        _row(**{"Price Variance Amount": "1,105.6", "Quick Pay Discount Amount": " -1.5e1 "}),
+    ]
+    _write_csv(tmp_path / "invoices.csv", rows)
+
+    df = read_invoice_data(replace(settings, input_raw_dir=tmp_path))
+
+    assert df.shape[0] == 2
+    np.testing.assert_array_equal(df["Quantity Variance Amount"].to_numpy(), [np.nan, 0.0])
+    np.testing.assert_array_equal(df["Price Variance Amount"].to_numpy(), [0.0, np.nan])
+    np.testing.assert_allclose(df["Quick Pay Discount Amount"].to_numpy(), [2.11, -15.0])
+
+
+def test_infinite_optional_amounts_are_kept(tmp_path: Path, settings: SettingsConfig) -> None:
+    rows = [_row(**{"Quantity Variance Amount": token}) for token in ("inf", "-Infinity")]
+    _write_csv(tmp_path / "invoices.csv", rows)
+
+    df = read_invoice_data(replace(settings, input_raw_dir=tmp_path))
+
+    np.testing.assert_array_equal(df["Quantity Variance Amount"].to_numpy(), [np.inf, -np.inf])
+
+
+def test_dates_accept_iso_and_coerce_invalid_values_to_null(
+    tmp_path: Path, settings: SettingsConfig
+) -> None:
+    rows = [
+        _row(**{"Payment Due Date": due_date})
+        for due_date in ("14/08/2023", "2023-08-14", "2023-08-14 10:30:00", "not a date")
+    ]
+    _write_csv(tmp_path / "invoices.csv", rows)
+
+    df = read_invoice_data(replace(settings, input_raw_dir=tmp_path))
+
+    expected = np.array(
+        ["2023-08-14", "2023-08-14", "2023-08-14", "NaT"], dtype="datetime64[ns]"
+    )
+    np.testing.assert_array_equal(df["Payment Due Date"].to_numpy(), expected)
+
+
+def test_writes_recreate_output_directory_removed_after_first_write(tmp_path: Path) -> None:
+    output_dir = tmp_path / "processed"
+    df = pd.DataFrame({"Shortage_Count": [1]})
+
+    write_csv(df, output_dir / "first.csv")
+    shutil.rmtree(output_dir)
+    write_csv(df, output_dir / "second.csv")
+    shutil.rmtree(output_dir)
+    write_parquet(df, output_dir / "third.parquet")
+
+    assert (output_dir / "third.parquet").exists()
+
+
+def test_parquet_round_trip_keeps_pipeline_dtypes(tmp_path: Path) -> None:
+    df = pd.DataFrame(
+        {
+            "Randomized Invoice": pd.array(["INV-1", None], dtype="string"),
+            "Payment Due Date": np.array(["2023-08-14", "NaT"], dtype="datetime64[ns]"),
+            "Payment_Year": pd.array([2023, None], dtype="Int64"),
+            "Invoice Amount": [105.0, np.nan],
+        }
+    )
+
+    round_tripped = read_parquet(write_parquet(df, tmp_path / "staging.parquet"))
+
+    pd.testing.assert_frame_equal(round_tripped, df)
@@ -0,0 +1,60 @@
+"""Tests for pipeline exports."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import pandas as pd
+
+from src.report import export_analytics_tables, export_shortage_outputs
+from src.utils import SettingsConfig
+
+
+def test_export_analytics_tables_writes_pandas_csv_format(
+    tmp_path: Path, settings: SettingsConfig
+) -> None:
+    tables = {
+        "total_shortage": pd.DataFrame({"Shortage_Count": [2], "Total_Shortage_USD": [100.0]}),
+        "annual_shortages": pd.DataFrame(
+            {
+                "Payment_Year": [2023, 2024],
+                "Shortage_Count": [1, 1],
+                "Total_Shortage_USD": [100.0, 12.34],
+                "Mean_Shortage_USD": [100.0, 12.34],
+            }
+        ),
+    }
+
+    paths = export_analytics_tables(tables, replace(settings, output_processed_dir=tmp_path))
+
+    assert set(paths) == {"total_shortage", "annual_shortages"}
+    assert paths["total_shortage"].read_text() == (
+        "Shortage_Count,Total_Shortage_USD\n"
+        "2,100.0\n"
+    )
+    assert paths["annual_shortages"].read_text() == (
+        "Payment_Year,Shortage_Count,Total_Shortage_USD,Mean_Shortage_USD\n"
+        "2023,1,100.0,100.0\n"
+        "2024,1,12.34,12.34\n"
+    )
+
+
+def test_export_shortage_outputs_keeps_only_flagged_rows_in_subset(
+    tmp_path: Path, settings: SettingsConfig
+) -> None:
+    df = pd.DataFrame(
+        {
+            "Randomized Invoice": pd.array(["INV-1", "INV-2", "INV-3"], dtype="string"),
+            "Shortage_Flag": [True, False, True],
+            "Shortage_Amount_USD": [10.0, 0.0, 2.5],
+        }
+    )
+
+    paths = export_shortage_outputs(df, replace(settings, output_processed_dir=tmp_path))
+
+    pd.testing.assert_frame_equal(pd.read_parquet(paths["shortages_flagged"]), df)
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(paths["shortages_only"]),
+        df[df["Shortage_Flag"]].reset_index(drop=True),
+    )
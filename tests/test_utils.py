@@ -0,0 +1,63 @@
+"""Tests for configuration loading."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from src.utils import load_rules, load_settings
+
+
+_SETTINGS_YAML = """\
+input_raw_dir: data/raw
+output_processed_dir: data/processed
+date_format: dayfirst
+aging_days_threshold: {threshold}
+currency_expected: USD
+round_decimals: 2
+partition_by_year: true
+tolerance_small_delta_usd: 0.01
+"""
+
+_RULES_YAML = """\
+eligible_statuses: [{status}]
+shortage_required_flags: [Any Deductions]
+use_strict_currency_check: true
+"""
+
+
+def _rewrite(path: Path, text: str) -> None:
+    """Rewrite ``path`` and move its modification time forward."""
+
+    previous_mtime_ns = path.stat().st_mtime_ns
+    path.write_text(text, encoding="utf-8")
+    # Coarse filesystem timestamps may not change within one test; force a new mtime.
+    os.utime(path, ns=(previous_mtime_ns + 1_000_000_000, previous_mtime_ns + 1_000_000_000))
+
+
+def test_load_settings_is_cached_until_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "settings.yaml"
+    path.write_text(_SETTINGS_YAML.format(threshold=90), encoding="utf-8")
+
+    first = load_settings(path)
+    assert load_settings(path) is first
+
+    _rewrite(path, _SETTINGS_YAML.format(threshold=30))
+    reloaded = load_settings(path)
+
+    assert reloaded is not first
+    assert reloaded.aging_days_threshold == 30
+
+
+def test_load_rules_is_cached_until_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "rules.yaml"
+    path.write_text(_RULES_YAML.format(status="paid"), encoding="utf-8")
+
+    first = load_rules(path)
+    assert load_rules(path) is first
+
+    _rewrite(path, _RULES_YAML.format(status="QUEUED_FOR_PAYMENT"))
+    reloaded = load_rules(path)
+
+    assert reloaded is not first
+    assert reloaded.eligible_statuses == frozenset({"QUEUED_FOR_PAYMENT"})